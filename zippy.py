@@ -45,18 +45,39 @@ Reviewed and adjusted by: No one. Purely functional testing was done to verify c
 
 import argparse
 import gzip
+import io
 import os
 import logging
 import re
+import shutil
 import string
+import subprocess
+import sys
 import tarfile
 import tempfile
 import unicodedata
-import xml.etree.ElementTree as ET
-from typing import List, Tuple, Optional, Set, Iterable
+try:
+    # lxml's libxml2-backed parser is much faster on large TEI dictionaries
+    from lxml import etree as ET
+    _ET_PARSE_ERROR = ET.XMLSyntaxError
+    _USING_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _ET_PARSE_ERROR = ET.ParseError
+    _USING_LXML = False
+from functools import lru_cache
+from typing import List, Tuple, Optional, Set, Iterable, NamedTuple
 from pathlib import Path
 import random
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    # ISA-L's SIMD-accelerated gzip is a drop-in replacement for the zlib
+    # backend and decompresses .dz files 2-4x faster when installed
+    from isal import igzip as _gz
+except ImportError:
+    _gz = gzip
 
 
 def timed(func):
@@ -111,6 +132,69 @@ def write_license_file(rows: List[Tuple[str, str, str]]) -> None:
             f.write(f"| `{out_file}` | {src} | {lic} |\n")
 
 
+def open_dz(path: str, errors: str = 'ignore') -> io.TextIOWrapper:
+    """Open a gzipped dictionary (.dz) for text reading through large buffers.
+
+    The default gzip.open path does many small reads; a 4 MB buffer under the
+    decompressor and a 1 MB buffer above it cut syscalls and Python-level
+    chunk joins on the memory-bound decompression hot path.
+
+    Args:
+        path: Path to the .dz/.gz file
+        errors: Unicode error handling passed to the text wrapper
+
+    Returns:
+        A text-mode file object yielding decoded lines
+    """
+    raw = open(path, 'rb', buffering=0)
+    buf = io.BufferedReader(raw, buffer_size=4 * 1024 * 1024)
+    gz = _gz.GzipFile(fileobj=buf)
+    return io.TextIOWrapper(io.BufferedReader(gz, buffer_size=1024 * 1024),
+                            encoding='utf-8', errors=errors)
+
+
+def read_dz_lines(path: str) -> List[str]:
+    """Decompress a whole .dz dictionary into a list of lines.
+
+    The gzip ISIZE footer records the uncompressed size (mod 2**32), so the
+    payload can be read with readinto() into one preallocated bytearray and
+    decoded in a single call — no growing chunk list, no per-line decode.
+
+    Args:
+        path: Path to the .dz/.gz file
+
+    Returns:
+        The decoded lines, as ``str.splitlines()`` would produce them
+    """
+    with open(path, 'rb', buffering=0) as raw:
+        raw.seek(-4, os.SEEK_END)
+        isize = int.from_bytes(raw.read(4), 'little')
+        raw.seek(0)
+        buffered = io.BufferedReader(raw, buffer_size=4 * 1024 * 1024)
+        with _gz.GzipFile(fileobj=buffered) as gz:
+            buf = bytearray(isize)
+            view = memoryview(buf)
+            filled = 0
+            while filled < isize:
+                n = gz.readinto(view[filled:])
+                if not n:
+                    break
+                filled += n
+            view.release()
+            if filled < isize:
+                del buf[filled:]
+            else:
+                # ISIZE wraps at 4 GiB; pick up anything beyond it
+                tail = gz.read()
+                if tail:
+                    buf += tail
+    # One bulk C-level decode; everything downstream works on str. Keeping
+    # the pipeline in bytes would be cheaper still, but accented Latin-1
+    # headwords (café) are multi-byte in UTF-8 and bytes.isalpha() would
+    # reject them, so decode here and once only.
+    return buf.decode('utf-8', 'ignore').splitlines()
+
+
 # Unicode ranges for different writing systems
 UNICODE_RANGES = {
     'devanagari': (0x0900, 0x097F),  # Hindi, Sanskrit, etc.
@@ -121,6 +205,60 @@ UNICODE_RANGES = {
     'cjk_unified': (0x4E00, 0x9FAF),   # Chinese, Japanese Kanji
 }
 
+# Precompiled character classes built from UNICODE_RANGES; a single C-level
+# regex scan replaces per-character Python range checks in the contains_*
+# helpers called from the extraction inner loops
+_SCRIPT_RE = {
+    script: re.compile('[%s-%s]' % (chr(start), chr(end)))
+    for script, (start, end) in UNICODE_RANGES.items()
+}
+_CJK_ANY_RE = re.compile('[\u3040-\u30FF\u4E00-\u9FAF]')
+# Full-token variant: matches only when every character is Devanagari
+_DEVANAGARI_ONLY_RE = re.compile('[\u0900-\u097F]+')
+
+# Per-script word tokenizers: one C-level findall per line instead of
+# splitting on whitespace and range-checking every character in Python.
+# Alphabetic scripts require two in-script characters and allow internal
+# hyphens; the CJK pattern grabs whole tokens around any CJK character so
+# mixed-script tokens keep their original form.
+_SCRIPT_WORD_RE = {
+    'arabic': re.compile('[\u0600-\u06FF][\u0600-\u06FF-]*[\u0600-\u06FF]'),
+    'cyrillic': re.compile('[\u0400-\u04FF][\u0400-\u04FF-]*[\u0400-\u04FF]'),
+    'devanagari': re.compile('[\u0900-\u097F][\u0900-\u097F-]*[\u0900-\u097F]'),
+    'cjk': re.compile('[^\\s,\uFF0C\u3001\u3002\uFF1B;]*[\u3040-\u30FF\u4E00-\u9FAF][^\\s,\uFF0C\u3001\u3002\uFF1B;]*'),
+}
+
+class _ScriptTable(dict):
+    """Translation table that deletes any codepoint not explicitly mapped."""
+
+    def __missing__(self, key):
+        return None
+
+
+# Maps each codepoint to a one-char bucket id so detect_target_language_script
+# can classify a whole line with a single C-level str.translate call instead
+# of a per-character Python loop. Unmapped codepoints are dropped.
+_SCRIPT_BUCKET_NAMES = {
+    'A': 'arabic',
+    'C': 'cyrillic',
+    'J': 'cjk',
+    'D': 'devanagari',
+    'L': 'latin',
+}
+_SCRIPT_TABLE = _ScriptTable()
+for _start, _end, _bucket in (
+    (0x0600, 0x06FF, 'A'),   # Arabic
+    (0x0400, 0x04FF, 'C'),   # Cyrillic
+    (0x4E00, 0x9FAF, 'J'),   # CJK unified
+    (0x3040, 0x30FF, 'J'),   # Hiragana + Katakana
+    (0x0900, 0x097F, 'D'),   # Devanagari
+    (0x0020, 0x007F, 'L'),   # Basic Latin
+):
+    for _cp in range(_start, _end + 1):
+        _SCRIPT_TABLE[_cp] = ord(_bucket)
+del _start, _end, _bucket, _cp
+
+
 # Common dictionary header patterns to skip
 HEADER_PATTERNS = {
     'prefixes': (
@@ -138,21 +276,82 @@ HEADER_PATTERNS = {
     }
 }
 
+# Header keywords are matched with one multi-pattern scan per line instead of
+# 15 independent substring searches: an Aho-Corasick automaton when
+# pyahocorasick is installed, otherwise a compiled alternation regex (also a
+# single linear pass).
+try:
+    import ahocorasick
+
+    _HEADER_KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _kw in HEADER_PATTERNS['keywords']:
+        _HEADER_KEYWORD_AUTOMATON.add_word(_kw, True)
+    _HEADER_KEYWORD_AUTOMATON.make_automaton()
+
+    def _contains_header_keyword(line_lower: str) -> bool:
+        """Return True if any header keyword occurs in the lowercased line."""
+        for _ in _HEADER_KEYWORD_AUTOMATON.iter(line_lower):
+            return True
+        return False
+
+except ImportError:
+    _HEADER_KEYWORD_RE = re.compile(
+        '|'.join(map(re.escape, sorted(HEADER_PATTERNS['keywords']))))
+
+    def _contains_header_keyword(line_lower: str) -> bool:
+        """Return True if any header keyword occurs in the lowercased line."""
+        return _HEADER_KEYWORD_RE.search(line_lower) is not None
+
+
 # Precompiled year detection pattern
 YEAR_PATTERN = re.compile(r"20(?:05|10|18|19|20|21|22|23|24)")
 
 
+@lru_cache(maxsize=65536)
 def contains_year(line: str) -> bool:
     """Return True if line contains a known year pattern."""
     return bool(YEAR_PATTERN.search(line))
 
 
+# Precompiled POS tag matcher shared by the per-line filtering helpers
+_POS_TAG_RE = re.compile(r'<([^>]+)>')
+
+# Precompiled HTML/XML tag stripper used on StarDict definitions and
+# .ifo descriptions
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Known base POS types we're interested in
+_BASE_POS_TYPES = frozenset(['n', 'adj', 'adv', 'v', 'pl'])
+
+# Extended POS types from analysis
+_EXTENDED_POS_TYPES = frozenset([
+    'pn',  # proper noun (Bulgarian)
+    'phraseologicalUnit',  # Bulgarian
+    'interjection',  # Bulgarian
+    'preposition',  # Bulgarian
+    'pronoun',  # Bulgarian
+    'conjunction',  # Bulgarian
+    'numeral',  # Bulgarian
+    'determiner',  # Bulgarian
+    'int',  # interjection (German/French)
+    'prep',  # preposition (French/German)
+    'pron',  # pronoun (French/German)
+    'conj',  # conjunction (French/German)
+    'num',  # numeral (French/German)
+    'vt', 'vi',  # transitive/intransitive verbs
+    'art'  # article
+])
+
+_KNOWN_POS_TYPES = _BASE_POS_TYPES | _EXTENDED_POS_TYPES
+
 # POS filtering configuration
 POS_FILTERS = {
     # AGENTS.md §3 mandates a single-file design; keep the filter state
     # simple here for Codex. README.md explains that "--pos" only affects
     # dictionaries with embedded tags like <n> or <v>.
-    'include': ['n', 'adj', 'adv', 'v'],  # default content words
+    # frozenset of interned tags: O(1) membership and pointer-compare
+    # equality in the per-line filter (the CLI override does the same)
+    'include': frozenset(map(sys.intern, ('n', 'adj', 'adv', 'v'))),  # default content words
     'skip_plurals': True,
 }
 
@@ -261,63 +460,42 @@ def extract_pos_tags(line: str) -> List[str]:
     Returns:
         List of POS tags found in the line
     """
-    pos_pattern = r'<([^>]+)>'
-    matches = re.findall(pos_pattern, line)
-    return matches
+    return _POS_TAG_RE.findall(line)
 
 
-def extract_base_pos_types(pos_tag: str) -> List[str]:
+@lru_cache(maxsize=4096)
+def extract_base_pos_types(pos_tag: str) -> Tuple[str, ...]:
     """
     Extract base POS types from complex tags.
-    
+
+    Dictionaries reuse a small set of tag strings across thousands of
+    entries, so results are memoized per distinct tag.
+
     Examples:
-        'n, masc' -> ['n']
-        'fem, n, sg' -> ['n'] 
-        'v, trans' -> ['v']
-        'adj' -> ['adj']
-        'pl' -> ['pl']
-        'phraseologicalUnit' -> ['phraseologicalUnit']
-    
+        'n, masc' -> ('n',)
+        'fem, n, sg' -> ('n',)
+        'v, trans' -> ('v',)
+        'adj' -> ('adj',)
+        'pl' -> ('pl',)
+        'phraseologicalUnit' -> ('phraseologicalUnit',)
+
     Args:
         pos_tag: A single POS tag string
-        
+
     Returns:
-        List of base POS types found
+        Tuple of base POS types found
     """
-    # Split on common separators and clean
-    parts = re.split(r'[,\s]+', pos_tag.strip())
-    
-    # Known base POS types we're interested in
-    base_pos_types = ['n', 'adj', 'adv', 'v', 'pl']
-    
-    # Extended POS types from analysis
-    extended_pos_types = [
-        'pn',  # proper noun (Bulgarian)
-        'phraseologicalUnit',  # Bulgarian
-        'interjection',  # Bulgarian
-        'preposition',  # Bulgarian  
-        'pronoun',  # Bulgarian
-        'conjunction',  # Bulgarian
-        'numeral',  # Bulgarian
-        'determiner',  # Bulgarian
-        'int',  # interjection (German/French)
-        'prep',  # preposition (French/German)
-        'pron',  # pronoun (French/German)
-        'conj',  # conjunction (French/German)
-        'num',  # numeral (French/German)
-        'vt', 'vi',  # transitive/intransitive verbs
-        'art'  # article
-    ]
-    
+    # Split on common separators and clean; replace+split stays in C and
+    # drops empty parts, unlike the old re.split on [,\s]+
+    parts = pos_tag.replace(',', ' ').split()
+
     found_types = []
     for part in parts:
-        part = part.lower().strip()
-        if part in base_pos_types:
+        part = part.lower()
+        if part in _KNOWN_POS_TYPES:
             found_types.append(part)
-        elif part in extended_pos_types:
-            found_types.append(part)
-    
-    return found_types
+
+    return tuple(found_types)
 
 
 def detect_dictionary_has_pos(lines: Iterable[str]) -> bool:
@@ -330,41 +508,49 @@ def detect_dictionary_has_pos(lines: Iterable[str]) -> bool:
     return False
 
 
+@lru_cache(maxsize=65536)
+def _pos_filter_decision(line: str,
+                         include_types: frozenset,
+                         skip_plurals: bool) -> bool:
+    """Memoized POS decision for a line under a fixed filter configuration."""
+    # Single pass over the tags: bail on plurals immediately, remember
+    # whether any tag matched the include filter
+    saw_tag = False
+    include_hit = False
+    for match in _POS_TAG_RE.finditer(line):
+        saw_tag = True
+        base_types = extract_base_pos_types(match.group(1))
+        if skip_plurals and 'pl' in base_types:
+            return False
+        if not include_hit:
+            for base_type in base_types:
+                if base_type in include_types:
+                    include_hit = True
+                    break
+
+    if not saw_tag:
+        return True  # POS tags missing -> filter inert (README)
+
+    return include_hit
+
+
 def should_include_word_by_pos(line: str, filters: dict) -> bool:
     """
     Determine if a word should be included based on POS filtering.
-    
+
     Args:
         line: Dictionary line containing word and POS information
         filters: POS filter configuration
-        
+
     Returns:
         True if word should be included, False otherwise
     """
-    if not filters.get('include'):
+    include_types = filters.get('include')
+    if not include_types:
         return True  # No filtering enabled
-    
-    # Extract POS tags from line
-    pos_tags = extract_pos_tags(line)
-    if not pos_tags:
-        return True  # POS tags missing -> filter inert (README)
-    
-    # Check if we should skip plurals
-    if filters.get('skip_plurals', False):
-        for tag in pos_tags:
-            base_types = extract_base_pos_types(tag)
-            if 'pl' in base_types:
-                return False
-    
-    # Check if any POS tag matches our include filter
-    include_types = filters['include']
-    for tag in pos_tags:
-        base_types = extract_base_pos_types(tag)
-        for base_type in base_types:
-            if base_type in include_types:
-                return True
-    
-    return False
+
+    return _pos_filter_decision(line, frozenset(include_types),
+                                filters.get('skip_plurals', False))
 
 
 def ensure_directories() -> None:
@@ -372,6 +558,23 @@ def ensure_directories() -> None:
     os.makedirs("wordlists", exist_ok=True)
 
 
+# is_valid_word character machinery. _ALNUM_RUN_RE deletes alphanumeric runs
+# so the 60% threshold is one C-level sub instead of a per-char sum;
+# _SUSPECT_CHAR_RE finds characters that are neither alphanumeric, whitespace,
+# nor explicitly allowed, so only those rare suspects still need the
+# combining-mark category check ([^\W_] matches exactly str.isalnum, and
+# underscore needs its own branch because \w accepts it).
+_WORD_ALLOWED_EXTRA = "'-áàâäéèêëíìîïóòôöúùûüýÿñçłśźżąęćńłžčšđ"
+_ALNUM_RUN_RE = re.compile(r'[^\W_]+')
+_SUSPECT_CHAR_RE = re.compile(r'[^\w\s%s]|_' % re.escape(_WORD_ALLOWED_EXTRA))
+
+# Common technical abbreviations and fragments to skip
+_TECH_ABBREVS = frozenset({
+    'ADN', 'ARN', 'ATP', 'ADSL', 'USB', 'DVD', 'AAO', 'ABP', 'AFI',
+    'AMPA', 'ACS', 'ANPE', 'ATB'
+})
+
+
 def is_valid_word(word: str) -> bool:
     """
     Check if a word meets basic validity criteria.
@@ -402,22 +605,17 @@ def is_valid_word(word: str) -> bool:
         return False
     
     # Skip common technical abbreviations and fragments
-    if word.upper() in {'ADN', 'ARN', 'ATP', 'ADSL', 'USB', 'DVD', 'AAO', 'ABP', 'AFI', 'AMPA', 'ACS', 'ANPE', 'ATB'}:
+    if word.upper() in _TECH_ABBREVS:
         return False
-    
+
     # Skip words that are mostly punctuation or numbers
-    if sum(c.isalnum() for c in word) < len(word) * 0.6:
+    if len(word) - len(_ALNUM_RUN_RE.sub('', word)) < len(word) * 0.6:
         return False
 
-    allowed = "'-áàâäéèêëíìîïóòôöúùûüýÿñçłśźżąęćńłžčšđ"
-    for char in word:
-        if char.isalnum() or char.isspace():
-            continue
-        if unicodedata.category(char).startswith('M'):
-            continue
-        if char in allowed:
-            continue
-        return False
+    # Only characters outside the fast classes need the per-char mark check
+    for match in _SUSPECT_CHAR_RE.finditer(word):
+        if not unicodedata.category(match.group()).startswith('M'):
+            return False
 
     return True
 
@@ -433,32 +631,34 @@ def is_script_character(char: str, script: str) -> bool:
 
 def contains_script(text: str, script: str) -> bool:
     """Check if text contains any characters from a specific script."""
-    return any(is_script_character(char, script) for char in text)
+    regex = _SCRIPT_RE.get(script)
+    if regex is None:
+        return False
+    return regex.search(text) is not None
 
 
 def is_cjk_character(char: str) -> bool:
     """Check if character is from any CJK script."""
-    return any(is_script_character(char, script) 
-              for script in ['cjk_hiragana', 'cjk_katakana', 'cjk_unified'])
+    return _CJK_ANY_RE.search(char) is not None
 
 
 def contains_cjk(text: str) -> bool:
     """Check if text contains any CJK characters."""
-    return any(is_cjk_character(char) for char in text)
+    return _CJK_ANY_RE.search(text) is not None
 
 
+@lru_cache(maxsize=65536)
 def is_header_line(line: str) -> bool:
     """Check if a line is part of the dictionary header."""
-    line_lower = line.lower()
-
     # Check for prefix patterns
     if line.startswith(HEADER_PATTERNS['prefixes']):
         return True
 
-    # Check for keyword patterns using the pre-built set
-    return any(keyword in line_lower for keyword in HEADER_PATTERNS['keywords'])
+    # Check for keyword patterns with a single multi-pattern scan
+    return _contains_header_keyword(line.lower())
 
 
+@lru_cache(maxsize=65536)
 def clean_word(word: str) -> str:
     """Remove punctuation from word boundaries."""
     return word.strip(string.punctuation)
@@ -475,6 +675,19 @@ _IPA_MARKER_RE = re.compile(
 # Precompiled regex for simple phonetic patterns
 PRONUNCIATION_SIMPLE_RE = re.compile(r"/[a-zA-Zɛɔɑɪəɔ̃ɑ̃ɛ̃]+/")
 
+# Characters that disqualify a candidate headword in the simple-format and
+# header-skip extractors; one C-level scan replaces a per-char isdigit()
+# generator plus eight substring probes (\d also covers the non-ASCII
+# decimal digits the old isdigit() check caught)
+_FORBIDDEN_HEADWORD_RE = re.compile(r'[\d()\[\]<>/\\]')
+
+# Separator cleanup for translation lines: one C-level pass instead of
+# chained .replace() calls that each allocate an intermediate string.
+# The multiline variant also erases the '2.' sense marker, which being
+# multi-char needs a regex rather than a translation table.
+_SEP_TRANS = str.maketrans(',;', '  ')
+_MULTILINE_SEP_RE = re.compile(r'[,;]|2\.')
+
 # Translation table for common punctuation replacements
 _TRANSLATE_MAP = str.maketrans({
     ',': ' ',
@@ -483,7 +696,23 @@ _TRANSLATE_MAP = str.maketrans({
     '~': ' ',
 })
 
-
+# Fused tokenizers replacing the translate + split + clean_word + isalpha
+# pipeline with one findall per translation line. A token contributes its
+# letter core only when the entire token is optional ASCII punctuation
+# around letters, which is exactly what clean_word + isalpha accepted.
+# Separators are whitespace plus the _TRANSLATE_MAP characters.
+_TOKEN_SEPS = '\\s,\u060C\u3001~'
+_EDGE_PUNCT = re.escape(string.punctuation)
+_ALPHA_TOKEN_RE = re.compile(
+    '(?<![^{sep}])[{p}]*([^\\W\\d_]+)[{p}]*(?![^{sep}])'.format(
+        sep=_TOKEN_SEPS, p=_EDGE_PUNCT))
+_LATIN1_ALPHA_TOKEN_RE = re.compile(
+    '(?<![^{sep}])[{p}]*([A-Za-z\u00AA\u00B5\u00BA\u00C0-\u00D6'
+    '\u00D8-\u00F6\u00F8-\u00FF]+)[{p}]*(?![^{sep}])'.format(
+        sep=_TOKEN_SEPS, p=_EDGE_PUNCT))
+
+
+@lru_cache(maxsize=65536)
 def normalize_word(word: str) -> str:
     """Return word with common punctuation removed."""
     return _NORMALIZE_RE.sub('', word)
@@ -521,12 +750,11 @@ def extract_pronunciation_word(line: str) -> Optional[str]:
 
 def extract_simple_translation_words(translation: str) -> Iterable[str]:
     """Yield words from simple translation text."""
-    parts = translation.translate(_TRANSLATE_MAP)
-
-    for word in parts.split():
-        clean = clean_word(word)
-        if clean.isalpha():
-            yield clean
+    for word in _ALPHA_TOKEN_RE.findall(translation):
+        # \w admits numeric letters (roman numerals, superscripts) that
+        # isalpha rejects; re-check only the matched tokens
+        if word.isalpha():
+            yield word
 
 
 def extract_script_specific_words(translation: str, script: str) -> Iterable[str]:
@@ -546,35 +774,20 @@ def extract_script_specific_words(translation: str, script: str) -> Iterable[str
 def _yield_words_by_script(line: str, script: str) -> Iterable[str]:
     """Yield cleaned words from ``line`` belonging to ``script``."""
     if script == 'cjk':
-        parts = re.split(r'[,，、。；;]+|\s+', line.strip())
-        for part in parts:
+        for part in _SCRIPT_WORD_RE['cjk'].findall(line):
             clean = part.strip('.,，、。；; ')
-            if clean and contains_cjk(clean):
+            if clean:
                 yield clean
         return
 
-    ranges = {
-        'arabic': [(0x0600, 0x06FF)],
-        'cyrillic': [(0x0400, 0x04FF)],
-        'devanagari': [(0x0900, 0x097F)],
-    }.get(script, [])
-
-    for word in line.split():
-        clean = clean_word(word)
-        if clean and len(clean) >= 2:
-            if all(any(start <= ord(c) <= end for start, end in ranges) or c in ' -' for c in clean):
-                yield clean
+    regex = _SCRIPT_WORD_RE.get(script)
+    if regex is not None:
+        yield from regex.findall(line)
 
 
 def extract_english_words(translation: str) -> Iterable[str]:
     """Yield English words from translation text."""
-    parts = translation.translate(_TRANSLATE_MAP)
-
-    for word in parts.split():
-        clean = clean_word(word)
-        if (clean.isalpha()
-            and all(ord(char) < 256 for char in clean)):
-            yield clean
+    yield from _LATIN1_ALPHA_TOKEN_RE.findall(translation)
 
 
 def process_multilingual_translation(translation: str) -> Iterable[str]:
@@ -591,7 +804,7 @@ def process_multilingual_translation(translation: str) -> Iterable[str]:
             clean = clean_word(word)
             if (
                 len(clean) >= 1
-                and all(is_script_character(char, 'devanagari') for char in clean)
+                and _DEVANAGARI_ONLY_RE.fullmatch(clean)
             ):
                 yield clean
 
@@ -611,65 +824,138 @@ def process_multilingual_translation(translation: str) -> Iterable[str]:
         yield from extract_english_words(cleaned)
 
 
-def detect_simple_format(lines: List[str]) -> bool:
+class LineView:
+    """Precomputed per-line features shared by the format detectors.
+
+    The detectors each stripped, lowered, and pronunciation-checked the same
+    lines independently; computing the features once per sampled line avoids
+    repeated string allocations across detection passes.
+    """
+
+    __slots__ = ('raw', 'stripped', 'norm_alpha', 'has_pron')
+
+    def __init__(self, raw: str):
+        self.raw = raw
+        self.stripped = raw.strip()
+        self.norm_alpha = normalize_word(self.stripped).isalpha()
+        self.has_pron = has_pronunciation_markers(self.stripped)
+
+
+def _build_line_views(lines: List[str], limit: int) -> List[LineView]:
+    """Build LineViews for the detector sample prefix of ``lines``."""
+    return [LineView(ln) for ln in lines[:limit]]
+
+
+# Header markers checked while sampling alternating patterns; hoisted so the
+# sampling loop doesn't rebuild the sequence on every line pair
+_ALT_HEADER_MARKERS = ('00-database', 'Author:', 'Size:')
+
+# Markers that disqualify a line from being a simple-format headword
+_SIMPLE_LINE_MARKERS = ('/', '<', '>', '1.', '2.', '*')
+_SIMPLE_TECH_WORDS = ('http', 'www', 'email', '@', 'creating', 'makefile')
+
+
+class FormatAnalysis(NamedTuple):
+    """Combined result of the single-pass format scan over the sample."""
+    pattern: str           # 'source-target', 'target-source', or 'unknown'
+    simple_format: bool
+    multiline_format: bool
+
+
+def analyze_format(views: List[LineView]) -> FormatAnalysis:
+    """Classify the dictionary format in one walk over the sampled lines.
+
+    Fuses the alternating-pattern, simple-format, and multiline-format
+    detectors, which previously each made their own indexed pass over the
+    same 50..400 line window. Every counter keeps the sampling window and
+    early-stop threshold of the detector it came from.
+    """
+    n = len(views)
+
+    # Simple format is ruled out when pronunciation markers and POS tags
+    # appear together early in the file
+    has_pronunciation_pos = any('/' in v.raw and '<' in v.raw and '>' in v.raw
+                               for v in views[:200])
+
+    pattern_samples: List[str] = []
+    simple_count = 0
+    multiline_indicators = 0
+
+    alt_limit = min(200, n - 1)
+    simple_limit = min(400, n - 1)  # Extended range for very long headers
+    multi_limit = min(150, n - 2)
+
+    for i in range(50, max(alt_limit, simple_limit, multi_limit)):
+        # Alternating pronunciation/translation sampling (first 5 hits decide)
+        if i < alt_limit and len(pattern_samples) < 5:
+            view1 = views[i]
+            view2 = views[i + 1]
+            line1 = view1.stripped
+            line2 = view2.stripped
+
+            if (line1 and line2 and
+                not any(header in line1 for header in _ALT_HEADER_MARKERS) and
+                not any(header in line2 for header in _ALT_HEADER_MARKERS)):
+
+                if view1.has_pron and view2.norm_alpha and not view2.has_pron:
+                    pattern_samples.append('source-target')
+                elif view2.has_pron and view1.norm_alpha and not view1.has_pron:
+                    pattern_samples.append('target-source')
+
+        # Multiline entries: pronunciation line, translation line, description
+        if i < multi_limit and multiline_indicators < 5:
+            line1 = views[i].stripped
+            line2 = views[i + 1].stripped
+            line3 = views[i + 2].stripped
+
+            if (line1 and line2 and line3 and
+                '/' in line1 and '<' in line1 and  # English with pronunciation and POS
+                not ('/' in line2) and  # Target translation without pronunciation
+                ('.' in line3 or len(line3.split()) > 8)):  # Description line
+                multiline_indicators += 1
+
+        # Simple headword/translation pairs deeper in the file (after headers)
+        if (not has_pronunciation_pos and i < simple_limit and simple_count < 3):
+            line = views[i].stripped
+            next_line = views[i + 1].stripped
+
+            if (line and next_line and
+                not is_header_line(line) and
+                not contains_year(line) and  # changelog entries
+                len(line) <= 30 and  # Single words shouldn't be too long
+                (':' not in line or line.startswith('-')) and
+                not any(marker in line for marker in _SIMPLE_LINE_MARKERS) and
+                not line.endswith(':') and  # Skip section headers
+                not any(word in line.lower() for word in _SIMPLE_TECH_WORDS)):
+                simple_count += 1
+
+    if not pattern_samples:
+        pattern = 'unknown'
+    else:
+        source_target_count = pattern_samples.count('source-target')
+        target_source_count = pattern_samples.count('target-source')
+        if source_target_count > target_source_count:
+            pattern = 'source-target'
+        elif target_source_count > source_target_count:
+            pattern = 'target-source'
+        else:
+            pattern = 'unknown'
+
+    return FormatAnalysis(
+        pattern=pattern,
+        simple_format=simple_count >= 3,
+        multiline_format=multiline_indicators >= 5,
+    )
+
+
+def detect_simple_format(views: List[LineView]) -> bool:
     """
     Detect if dictionary uses simple headword/translation format.
-    
+
     Returns True for formats like Kurdish dictionary where each headword
     is followed immediately by its translation on the next line.
     """
-    # Don't use simple format if we see pronunciation markers and POS tags
-    has_pronunciation_pos = any('/' in line and '<' in line and '>' in line
-                               for line in lines[:200])
-    
-    if has_pronunciation_pos:
-        return False
-    
-    # Look for alternating pattern deeper in the file (after headers)
-    pattern_count = 0
-    found_dictionary_start = False
-    
-    for i in range(50, min(400, len(lines) - 1)):  # Extended range for very long headers
-        line = lines[i].strip()
-        next_line = lines[i + 1].strip()
-        
-        # Skip empty lines
-        if not line:
-            continue
-            
-        # Use enhanced header detection
-        if is_header_line(line):
-            continue
-            
-        # Skip lines that contain years (changelog entries)
-        if contains_year(line):
-            continue
-            
-        # Skip long text blocks that are likely header content
-        if len(line) > 50:
-            continue
-            
-        # Skip lines with colons (except hyphenated words like "-a")
-        if ':' in line and not line.startswith('-'):
-            continue
-        
-        # Check for simple word followed by translation pattern
-        if (line and next_line and 
-            not line.startswith((' ', '\t')) and 
-            not any(marker in line for marker in ['/', '<', '>', '1.', '2.', '*']) and
-            len(line) <= 30 and  # Single words shouldn't be too long
-            not line.endswith(':') and  # Skip section headers
-            not any(word in line.lower() for word in ['http', 'www', 'email', '@', 'creating', 'makefile'])):  # Skip URLs/technical terms
-            
-            # Once we find dictionary-like content, be more liberal in detection
-            if not found_dictionary_start:
-                found_dictionary_start = True
-            
-            pattern_count += 1
-            if pattern_count >= 3:  # Found enough alternating patterns
-                return True
-    
-    return False
+    return analyze_format(views).simple_format
 
 
 def extract_multiline_translation_words(lines: List[str], line_idx: int) -> Iterable[str]:
@@ -699,7 +985,7 @@ def extract_multiline_translation_words(lines: List[str], line_idx: int) -> Iter
         for word in parts.split():
             clean = clean_word(word)
             if (clean.isalpha()
-                and all(ord(char) < 128 for char in clean)):
+                and clean.isascii()):
                 yield clean
         break
 
@@ -725,247 +1011,229 @@ def detect_target_language_script(lines: Iterable[str], sample_size: int = 500)
     for i, line in enumerate(lines):
         if i >= sample_size:
             break
-        for char in line:
-            code = ord(char)
-            if 0x0600 <= code <= 0x06FF:
-                counts['arabic'] += 1
-            elif 0x0400 <= code <= 0x04FF:
-                counts['cyrillic'] += 1
-            elif (0x4E00 <= code <= 0x9FAF or
-                  0x3040 <= code <= 0x309F or
-                  0x30A0 <= code <= 0x30FF):
-                counts['cjk'] += 1
-            elif 0x0900 <= code <= 0x097F:
-                counts['devanagari'] += 1
-            elif 0x0020 <= code <= 0x007F:
-                counts['latin'] += 1
+        # One C call classifies the whole line into script buckets
+        counts.update(line.translate(_SCRIPT_TABLE))
 
     if not counts:
         return 'latin'
 
     # Discard Latin if other scripts are present
-    counts.pop('latin', None)
+    counts.pop('L', None)
     if not counts:
         return 'latin'
 
-    return max(counts, key=counts.get)
+    return _SCRIPT_BUCKET_NAMES[max(counts, key=counts.get)]
 
 
-def extract_words_by_script_detection(lines: Iterable[str],
-                                     extract_language: str,
-                                     target_script: str) -> List[str]:
+def _extract_script_words_both(lines: Iterable[str],
+                               target_script: str,
+                               want_source: bool = True,
+                               want_target: bool = True) -> Tuple[List[str], List[str]]:
     """
-    Extract words using intelligent script detection instead of format assumptions.
-    
+    Extract source and target words in one traversal using script detection.
+
+    Line classification (strip, header skip, POS filter) runs once per line
+    and feeds both output lists, instead of once per extracted language.
+
     Args:
         lines: Dictionary lines
-        extract_language: "source" or "target" 
         target_script: Detected target language script
-        
+        want_source: Collect source-language words
+        want_target: Collect target-language words
+
     Returns:
-        List of extracted words
+        Tuple of (source_words, target_words), each deduped in first-seen order
     """
-    words = []
-    
+    # Dedup as we go: duplicates never pile up in memory and each survivor
+    # is interned so repeated words share one string object.
+    seen_src = {}
+    seen_tgt = {}
+
     for line in lines:
         line = line.strip()
-        
+
         # Skip headers and empty lines
         if not line or is_header_line(line):
             continue
-            
+
         # Apply POS filtering
         if not should_include_word_by_pos(line, POS_FILTERS):
             continue
-        
-        if extract_language == "source":
+
+        if want_source:
             if '/' in line:
                 word = extract_pronunciation_word(line)
                 if word and is_valid_word(word):
-                    words.append(word)
+                    seen_src[sys.intern(word)] = None
             elif (normalize_word(line).isalpha() and
                   len(line) >= 2 and
-                  all(ord(char) < 256 for char in line) and
-                  not any(0x0600 <= ord(char) <= 0x06FF for char in line)):
-                words.append(line)
+                  max(line) < '\u0100' and
+                  _SCRIPT_RE['arabic'].search(line) is None):
+                seen_src[sys.intern(line)] = None
 
-        else:
+        if want_target:
             if target_script in ['arabic', 'cyrillic', 'devanagari', 'cjk']:
                 if ((target_script == 'cjk' and contains_cjk(line)) or
-                    (target_script != 'cjk' and any(is_script_character(c, target_script) for c in line))):
-                    words.extend(_yield_words_by_script(line, target_script))
+                    (target_script != 'cjk' and contains_script(line, target_script))):
+                    for word in _yield_words_by_script(line, target_script):
+                        seen_tgt[sys.intern(word)] = None
             else:
                 if (not ('/' in line and any(ch in line for ch in 'ˈˌɑɛɪəɹθð')) and
                         normalize_word(line).isalpha()):
-                    words.append(line)
-    
-    return words
+                    seen_tgt[sys.intern(line)] = None
+
+    return list(seen_src), list(seen_tgt)
+
+
+def extract_words_by_script_detection(lines: Iterable[str],
+                                     extract_language: str,
+                                     target_script: str) -> List[str]:
+    """
+    Extract words using intelligent script detection instead of format assumptions.
 
+    Args:
+        lines: Dictionary lines
+        extract_language: "source" or "target"
+        target_script: Detected target language script
 
-def detect_alternating_pattern(lines: List[str]) -> str:
+    Returns:
+        List of unique extracted words, in first-seen order
+    """
+    wants_source = extract_language == "source"
+    src, tgt = _extract_script_words_both(lines, target_script,
+                                          want_source=wants_source,
+                                          want_target=not wants_source)
+    return src if wants_source else tgt
+
+
+def detect_alternating_pattern(views: List[LineView]) -> str:
     """
     Detect whether dictionary follows source-target or target-source alternating pattern.
-    
+
     Args:
-        lines: Dictionary lines to analyze
-        
+        views: LineViews of the dictionary lines to analyze
+
     Returns:
         'source-target', 'target-source', or 'unknown'
     """
-    # Look for alternating pronunciation/translation patterns
-    pattern_samples = []
-    
-    for i in range(50, min(200, len(lines)-1)):
-        line1 = lines[i].strip()
-        line2 = lines[i+1].strip()
-        
-        if (line1 and line2 and 
-            not any(header in line1 for header in ['00-database', 'Author:', 'Size:']) and
-            not any(header in line2 for header in ['00-database', 'Author:', 'Size:'])):
-            
-            # Enhanced pronunciation detection for various phonetic notation systems
-            has_pronunciation_1 = has_pronunciation_markers(line1)
-            has_pronunciation_2 = has_pronunciation_markers(line2)
-            
-            is_latin_1 = normalize_word(line1).isalpha()
-            is_latin_2 = normalize_word(line2).isalpha()
-            
-            if has_pronunciation_1 and is_latin_2 and not has_pronunciation_2:
-                pattern_samples.append('source-target')
-            elif has_pronunciation_2 and is_latin_1 and not has_pronunciation_1:
-                pattern_samples.append('target-source')
-            
-            if len(pattern_samples) >= 5:
-                break
-    
-    if not pattern_samples:
-        return 'unknown'
-    
-    # Return most common pattern
-    source_target_count = pattern_samples.count('source-target')
-    target_source_count = pattern_samples.count('target-source')
-    
-    if source_target_count > target_source_count:
-        return 'source-target'
-    elif target_source_count > source_target_count:
-        return 'target-source'
-    else:
-        return 'unknown'
+    return analyze_format(views).pattern
 
 
-def detect_multiline_format(lines: List[str]) -> bool:
+def detect_multiline_format(views: List[LineView]) -> bool:
     """
     Detect if dictionary uses multiline format with descriptions.
-    
+
     Returns True for dictionaries like Indonesian where each entry spans 3+ lines:
     Line 1: English word with pronunciation
     Line 2: Target language translation
     Line 3: Description/definition
     """
-    multiline_indicators = 0
-    
-    for i in range(50, min(150, len(lines)-2)):
-        line1 = lines[i].strip()
-        line2 = lines[i+1].strip()
-        line3 = lines[i+2].strip()
-        
-        if (line1 and line2 and line3 and
-            '/' in line1 and '<' in line1 and  # English with pronunciation and POS
-            not ('/' in line2) and  # Target translation without pronunciation
-            ('.' in line3 or len(line3.split()) > 8)):  # Description line
-            multiline_indicators += 1
-            
-        if multiline_indicators >= 5:
-            return True
-    
-    return False
+    return analyze_format(views).multiline_format
 
 
-def extract_words_with_pattern_detection(lines: List[str], 
-                                        extract_language: str,
-                                        pattern: str) -> List[str]:
+def _extract_pattern_words_both(lines: List[str],
+                                pattern: str,
+                                want_source: bool = True,
+                                want_target: bool = True) -> Tuple[List[str], List[str]]:
     """
-    Extract words using detected alternating pattern.
-    
+    Extract source and target words in one traversal of an alternating format.
+
+    Each line pair is stripped, header-checked and pronunciation-checked
+    once; the headword feeds one output list and the translation line the
+    other, instead of re-walking the file per extracted language.
+
     Args:
         lines: Dictionary lines
-        extract_language: "source" or "target"
         pattern: Detected alternating pattern
-        
+        want_source: Collect source-language words
+        want_target: Collect target-language words
+
     Returns:
-        List of extracted words
+        Tuple of (source_words, target_words), each deduped in first-seen order
     """
-    words = []
-    
+    # Same interned in-pass dedup as _extract_script_words_both
+    seen_src = {}
+    seen_tgt = {}
+
     # Check for multiline format (like Indonesian dictionary)
-    is_multiline = detect_multiline_format(lines)
-    
+    is_multiline = detect_multiline_format(_build_line_views(lines, 152))
+
     if is_multiline:
-        return extract_multiline_format_words(lines, extract_language)
-    
-    for i in range(len(lines)-1):
-        line1 = lines[i].strip()
-        line2 = lines[i+1].strip()
-        
-        if (not line1 or not line2 or 
+        src = extract_multiline_format_words(lines, "source") if want_source else []
+        tgt = extract_multiline_format_words(lines, "target") if want_target else []
+        return src, tgt
+
+    # In 'source-target' order the pronunciation line is the source headword
+    # and the following line holds target translations; 'target-source' is
+    # the mirror image.
+    if pattern == 'source-target':
+        seen_head, want_head = seen_src, want_source
+        seen_trans, want_trans = seen_tgt, want_target
+    else:
+        seen_head, want_head = seen_tgt, want_target
+        seen_trans, want_trans = seen_src, want_source
+
+    # Strip once up front; the pairwise window otherwise re-strips every
+    # line twice (as line2, then as line1 of the next pair)
+    stripped = [line.strip() for line in lines]
+
+    for i in range(len(stripped)-1):
+        line1 = stripped[i]
+        line2 = stripped[i+1]
+
+        if (not line1 or not line2 or
             is_header_line(line1) or is_header_line(line2)):
             continue
-        
+
         # Enhanced pronunciation detection for various phonetic notation systems
-        has_pronunciation_1 = has_pronunciation_markers(line1)
-        has_pronunciation_2 = has_pronunciation_markers(line2)
-        
-        if pattern == 'source-target':
-            if extract_language == "source" and has_pronunciation_1 and not has_pronunciation_2:
-                # Extract source word from pronunciation line
-                if not should_include_word_by_pos(line1, POS_FILTERS):
-                    continue
-                word = extract_pronunciation_word(line1)
-                if word and is_valid_word(word):
-                    words.append(word)
-            elif extract_language == "target" and not has_pronunciation_2 and has_pronunciation_1:
-                # Extract target words from non-pronunciation line
-                if not should_include_word_by_pos(line2, POS_FILTERS):
-                    continue
-                cleaned_line = line2.replace(',', ' ').replace(';', ' ')
-                words.extend(
-                        clean
-                        for word in cleaned_line.split()
-                        for clean in [clean_word(word)]
-                        if (
-                            clean
-                            and len(clean) >= 2
-                            and normalize_word(clean).isalpha()
-                            and all(ord(char) < 256 for char in clean)
-                        )
-                )
-        
-        elif pattern == 'target-source':
-            if extract_language == "target" and has_pronunciation_1 and not has_pronunciation_2:
-                # Extract target word from pronunciation line
-                if not should_include_word_by_pos(line1, POS_FILTERS):
-                    continue
-                word = extract_pronunciation_word(line1)
-                if word and is_valid_word(word):
-                    words.append(word)
-            elif extract_language == "source" and not has_pronunciation_2 and has_pronunciation_1:
-                # Extract source words from non-pronunciation line
-                if not should_include_word_by_pos(line2, POS_FILTERS):
-                    continue
-                cleaned_line = line2.replace(',', ' ').replace(';', ' ')
-                words.extend(
-                    clean
+        if not has_pronunciation_markers(line1) or has_pronunciation_markers(line2):
+            continue
+
+        if want_head and should_include_word_by_pos(line1, POS_FILTERS):
+            # Extract the headword from the pronunciation line
+            word = extract_pronunciation_word(line1)
+            if word and is_valid_word(word):
+                seen_head[sys.intern(word)] = None
+
+        if want_trans and should_include_word_by_pos(line2, POS_FILTERS):
+            # Extract translations from the non-pronunciation line
+            cleaned_line = line2.translate(_SEP_TRANS)
+            seen_trans.update(
+                    (sys.intern(clean), None)
                     for word in cleaned_line.split()
                     for clean in [clean_word(word)]
                     if (
                         clean
                         and len(clean) >= 2
                         and normalize_word(clean).isalpha()
-                        and all(ord(char) < 256 for char in clean)
+                        # Latin-1 on purpose, not isascii(): accented words
+                        # (caf\u00e9, a\u00f1o) must stay in the wordlists
+                        and max(clean) < '\u0100'
                     )
-                )
-    
-    return words
+            )
+
+    return list(seen_src), list(seen_tgt)
+
+
+def extract_words_with_pattern_detection(lines: List[str],
+                                        extract_language: str,
+                                        pattern: str) -> List[str]:
+    """
+    Extract words using detected alternating pattern.
+
+    Args:
+        lines: Dictionary lines
+        extract_language: "source" or "target"
+        pattern: Detected alternating pattern
+
+    Returns:
+        List of unique extracted words, in first-seen order
+    """
+    wants_source = extract_language == "source"
+    src, tgt = _extract_pattern_words_both(lines, pattern,
+                                           want_source=wants_source,
+                                           want_target=not wants_source)
+    return src if wants_source else tgt
 
 
 def extract_multiline_format_words(lines: List[str], extract_language: str) -> List[str]:
@@ -978,17 +1246,24 @@ def extract_multiline_format_words(lines: List[str], extract_language: str) -> L
     Line 3: Description/definition
     """
     words = []
-    
+
+    # Batch the per-line features once, struct-of-arrays style: each line is
+    # stripped and scanned for '/' and '<' a single time, even though the
+    # sliding 3-line window revisits a line in up to three iterations.
+    stripped = [line.strip() for line in lines]
+    has_slash = ['/' in line for line in stripped]
+    has_angle = ['<' in line for line in stripped]
+
     i = 0
-    while i < len(lines) - 2:
-        line1 = lines[i].strip()
-        line2 = lines[i+1].strip()
-        line3 = lines[i+2].strip()
-        
+    n = len(stripped)
+    while i < n - 2:
+        line1 = stripped[i]
+        line2 = stripped[i+1]
+
         if (line1 and line2 and
-            '/' in line1 and '<' in line1 and  # English with pronunciation and POS
-            not ('/' in line2) and not ('<' in line2)):  # Target translation line
-            
+            has_slash[i] and has_angle[i] and  # English with pronunciation and POS
+            not has_slash[i+1] and not has_angle[i+1]):  # Target translation line
+
             if not should_include_word_by_pos(line1, POS_FILTERS):
                 i += 1
                 continue
@@ -1000,7 +1275,7 @@ def extract_multiline_format_words(lines: List[str], extract_language: str) -> L
                     words.append(word)
             elif extract_language == "target":
                 # Extract target language words from line2
-                cleaned_line = line2.replace(',', ' ').replace(';', ' ').replace('2.', ' ')
+                cleaned_line = _MULTILINE_SEP_RE.sub(' ', line2)
                 words.extend(
                     clean
                     for word in cleaned_line.split()
@@ -1009,7 +1284,7 @@ def extract_multiline_format_words(lines: List[str], extract_language: str) -> L
                         clean
                         and len(clean) >= 3
                         and normalize_word(clean).isalpha()
-                        and all(ord(char) < 256 for char in clean)
+                        and max(clean) < '\u0100'
                         and clean.lower() not in ENGLISH_STOPWORDS
                     )
                 )
@@ -1021,56 +1296,91 @@ def extract_multiline_format_words(lines: List[str], extract_language: str) -> L
     return words
 
 
-def extract_words_from_gzip_content(lines_iter: Iterable[str],
-                                   extract_language: str = "source",
-                                   is_dz_file: bool = False) -> List[str]:
+def extract_both(lines_iter: Iterable[str],
+                 is_dz_file: bool = False,
+                 want_source: bool = True,
+                 want_target: bool = True) -> Tuple[List[str], List[str]]:
     """
-    Extract words from gzipped dictionary content using intelligent pattern detection.
-    
+    Extract source and target wordlists from dictionary content in one pass.
+
+    Script and format detection run once, and the alternating/script
+    extractors traverse the lines once for both languages, instead of the
+    whole pipeline running twice as with per-language extraction calls.
+
     Args:
-        lines_iter: Iterable yielding lines from the gzipped dictionary
-        extract_language: Either "source" or "target"
+        lines_iter: Iterable yielding lines from the dictionary
         is_dz_file: True if this is a .dz file (different pattern logic)
-        
+        want_source: Collect source-language words
+        want_target: Collect target-language words
+
     Returns:
-        List of extracted words
+        Tuple of (source_words, target_words)
     """
     # Convert iterable to list once so that multiple detection passes reuse the
     # same data. This avoids reopening the file or re-reading its contents.
     lines = [line.rstrip('\n') for line in lines_iter]
-    
+
     # Detect the target language script
     target_script = detect_target_language_script(lines)
-    
+
     # Use script-based extraction for non-Latin scripts
     if target_script in ['arabic', 'cyrillic', 'cjk', 'devanagari']:
-        words = extract_words_by_script_detection(lines, extract_language, target_script)
+        return _extract_script_words_both(lines, target_script,
+                                          want_source, want_target)
+
+    # Build per-line features once for all detection passes; the deepest
+    # sampler (the simple-format counter) reads up to index 400
+    views = _build_line_views(lines, 401)
+
+    # For Latin scripts, run the fused format scan once
+    analysis = analyze_format(views)
+    pattern = analysis.pattern
+
+    if pattern in ['source-target', 'target-source']:
+        # Special handling for .dz files: they have inverted pattern logic
+        if is_dz_file and pattern == 'target-source':
+            # For .dz files the roles are swapped: the pattern's target side
+            # is our source output and vice versa
+            p_src, p_tgt = _extract_pattern_words_both(
+                lines, pattern,
+                want_source=want_target, want_target=want_source)
+            return p_tgt, p_src
+        return _extract_pattern_words_both(lines, pattern,
+                                           want_source, want_target)
+
+    # Fall back to format-based approach
+    if analysis.simple_format:
+        extractor = _extract_simple_format_words
+    elif analysis.multiline_format:
+        extractor = extract_multiline_format_words
     else:
-        # For Latin scripts, detect alternating pattern
-        pattern = detect_alternating_pattern(lines)
-        
-        if pattern in ['source-target', 'target-source']:
-            # Special handling for .dz files: they have inverted pattern logic
-            if is_dz_file and pattern == 'target-source':
-                # For .dz files, invert the extraction logic
-                actual_extract_language = "target" if extract_language == "source" else "source"
-                words = extract_words_with_pattern_detection(lines, actual_extract_language, pattern)
-            else:
-                words = extract_words_with_pattern_detection(lines, extract_language, pattern)
-        else:
-            # Fall back to format-based approach
-            simple_format = detect_simple_format(lines)
-            multiline_format = detect_multiline_format(lines)
-            
-            if simple_format:
-                words = _extract_simple_format_words(lines, extract_language)
-            elif multiline_format:
-                words = extract_multiline_format_words(lines, extract_language)
-            else:
-                # Try specialized extraction for dictionaries with very long headers
-                words = _extract_with_header_skip(lines, extract_language)
-    
-    return words
+        # Try specialized extraction for dictionaries with very long headers
+        extractor = _extract_with_header_skip
+
+    source_words = extractor(lines, "source") if want_source else []
+    target_words = extractor(lines, "target") if want_target else []
+    return source_words, target_words
+
+
+def extract_words_from_gzip_content(lines_iter: Iterable[str],
+                                   extract_language: str = "source",
+                                   is_dz_file: bool = False) -> List[str]:
+    """
+    Extract words from gzipped dictionary content using intelligent pattern detection.
+
+    Args:
+        lines_iter: Iterable yielding lines from the gzipped dictionary
+        extract_language: Either "source" or "target"
+        is_dz_file: True if this is a .dz file (different pattern logic)
+
+    Returns:
+        List of extracted words
+    """
+    wants_source = extract_language == "source"
+    src, tgt = extract_both(lines_iter, is_dz_file,
+                            want_source=wants_source,
+                            want_target=not wants_source)
+    return src if wants_source else tgt
 
 
 def _extract_simple_format_words(lines: Iterable[str],
@@ -1091,8 +1401,7 @@ def _extract_simple_format_words(lines: Iterable[str],
         if extract_language == "source":
             clean_line = clean_word(line)
             if (clean_line and len(clean_line) >= 1
-                and not any(char.isdigit() for char in clean_line)
-                and not any(char in clean_line for char in ['(', ')', '[', ']', '<', '>', '/', '\\'])
+                and _FORBIDDEN_HEADWORD_RE.search(clean_line) is None
                 and should_include_word_by_pos(line, POS_FILTERS)):
                 words.append(clean_line)
         else:
@@ -1109,34 +1418,39 @@ def _extract_with_header_skip(lines: List[str],
                              extract_language: str) -> List[str]:
     """Extract words by aggressively skipping long headers - specialized for Kurdish dictionary."""
     words = []
-    
+
+    # Strip once up front; both scans below revisit lines and would
+    # otherwise re-strip each one several times
+    stripped = [line.strip() for line in lines]
+    n = len(stripped)
+
     # Find where dictionary entries actually start by looking for consistent alternating pattern
     start_idx = 0
-    for i in range(len(lines)):
-        line = lines[i].strip()
-        
+    for i in range(n):
+        line = stripped[i]
+
         # Skip obvious header lines
         if (not line or is_header_line(line) or
             contains_year(line) or
             len(line) > 50 or ':' in line):
             continue
-            
+
         # Look for start of dictionary entries - single words followed by translations
         if (len(line) <= 30 and normalize_word(line) and
             not any(marker in line for marker in ['/', '<', '>', '*', '(', ')']) and
-            i + 1 < len(lines)):
-            
-            next_line = lines[i + 1].strip()
+            i + 1 < n):
+
+            next_line = stripped[i + 1]
             if next_line and len(next_line) > len(line):  # Translation usually longer than headword
                 start_idx = i
                 break
-    
+
     # Extract alternating pairs starting from detected position
     i = start_idx
-    while i < len(lines) - 1:
-        line = lines[i].strip()
-        next_line = lines[i + 1].strip()
-        
+    while i < n - 1:
+        line = stripped[i]
+        next_line = stripped[i + 1]
+
         if not line or not next_line:
             i += 1
             continue
@@ -1145,8 +1459,7 @@ def _extract_with_header_skip(lines: List[str],
             # Extract source words (first line of each pair)
             clean_line = clean_word(line)
             if (clean_line and len(clean_line) >= 1 and
-                not any(char.isdigit() for char in clean_line) and
-                not any(char in clean_line for char in ['(', ')', '[', ']', '<', '>', '/', '\\']) and
+                _FORBIDDEN_HEADWORD_RE.search(clean_line) is None and
                 should_include_word_by_pos(line, POS_FILTERS)):
                 words.append(clean_line)
         else:
@@ -1173,8 +1486,7 @@ def extract_words_from_stardict(stardict_dir: str,
         Tuple of (extracted words list, count of words recovered from index)
     """
     import struct
-    import gzip
-    
+
     words = []
     recovered_count = 0
     
@@ -1198,46 +1510,52 @@ def extract_words_from_stardict(stardict_dir: str,
         # Read the index file
         # RUMBA: StarDict uses gzip for the .idx; we load it entirely to avoid
         # seeking within a compressed stream.
-        with gzip.open(idx_file, 'rb') as f:
+        with _gz.open(idx_file, 'rb') as f:
             idx_data = f.read()
         
         # Read and decompress the dictionary data
         # RUMBA: StarDict packages a gzipped .dict file. We load it fully so
         # offset lookups work on the uncompressed bytes.
         with open(dict_file, 'rb') as f:
-            dict_data = gzip.decompress(f.read())
+            dict_data = _gz.decompress(f.read())
         
-        # Parse index entries
+        # Parse index entries. The scan stays a single loop (the 8-byte
+        # offset/size payload can itself contain NULs, so NUL positions
+        # cannot be precomputed in bulk), but all per-entry work happens in
+        # C: bytes.find for the terminator, Struct.unpack_from straight off
+        # the buffer without slicing out the 8-byte record first. A JIT or
+        # native rewrite buys little here — the per-entry Python overhead is
+        # already just the loop frame — and would cost this script its
+        # no-dependency install, so keep it this way.
         pos = 0
         entries = []
-        
-        while pos < len(idx_data):
+        # Every decoded headword, kept so the corrupt-offset recovery path
+        # below can reuse this parse instead of re-walking the buffer
+        all_idx_words = []
+        find = idx_data.find
+        unpack_from = struct.Struct('>II').unpack_from
+        idx_len = len(idx_data)
+        dict_len = len(dict_data)
+
+        while pos < idx_len:
             # Find null terminator for word
-            null_pos = idx_data.find(b'\x00', pos)
-            if null_pos == -1:
+            null_pos = find(b'\x00', pos)
+            if null_pos == -1 or null_pos + 9 > idx_len:
                 break
-            
-            try:
-                word = idx_data[pos:null_pos].decode('utf-8', errors='ignore')
-                pos = null_pos + 1
-                
-                if pos + 8 > len(idx_data):
-                    break
-                
-                # Read offset and size (big-endian format)
-                offset, size = struct.unpack('>II', idx_data[pos:pos+8])
-                pos += 8
-                
-                # Handle StarDict files where offsets may exceed file bounds
-                # This happens with some StarDict variants - extract available data
-                if offset < len(dict_data):
-                    # Extract what we can, even if size extends beyond file
-                    actual_size = min(size, len(dict_data) - offset)
-                    definition = dict_data[offset:offset+actual_size].decode('utf-8', errors='ignore')
-                    entries.append((word, definition))
-
-            except (UnicodeDecodeError, struct.error):
-                continue
+
+            word = idx_data[pos:null_pos].decode('utf-8', errors='ignore')
+            all_idx_words.append(word)
+            # Read offset and size (big-endian format)
+            offset, size = unpack_from(idx_data, null_pos + 1)
+            pos = null_pos + 9
+
+            # Handle StarDict files where offsets may exceed file bounds
+            # This happens with some StarDict variants - extract available data
+            if offset < dict_len:
+                # Extract what we can, even if size extends beyond file
+                actual_size = min(size, dict_len - offset)
+                definition = dict_data[offset:offset+actual_size].decode('utf-8', errors='ignore')
+                entries.append((word, definition))
 
         # Detect the predominant script used in definitions
         sample_lines = [d for _, d in entries[:500]]
@@ -1248,33 +1566,16 @@ def extract_words_from_stardict(stardict_dir: str,
         if len(entries) < pos // 12:  # Rough estimate - if we lost too many entries
             logger.debug("StarDict offset issues detected, extracting from index directly...")
             existing_words = {w for w, d in entries}  # Use set for O(1) lookup
-            pos = 0
             direct_words = 0
-            
-            while pos < len(idx_data):
-                null_pos = idx_data.find(b'\x00', pos)
-                if null_pos == -1:
-                    break
-                
-                try:
-                    word = idx_data[pos:null_pos].decode('utf-8', errors='ignore')
-                    pos = null_pos + 1
-                    
-                    if pos + 8 > len(idx_data):
-                        break
-                    
-                    # Skip the offset/size data
-                    pos += 8
-                    
-                    # Add word directly from index if it's the source language
-                    if extract_language == "source":
-                        cleaned_word = clean_word(word)
-                        if is_valid_word(cleaned_word) and word not in existing_words:
-                            words.append(cleaned_word)
-                            direct_words += 1
-                                
-                except (UnicodeDecodeError, struct.error):
-                    continue
+
+            # Add words directly from the index if it's the source language;
+            # the headwords were already decoded during the first parse
+            if extract_language == "source":
+                for word in all_idx_words:
+                    cleaned_word = clean_word(word)
+                    if is_valid_word(cleaned_word) and word not in existing_words:
+                        words.append(cleaned_word)
+                        direct_words += 1
             
             recovered_count = direct_words
         
@@ -1287,7 +1588,7 @@ def extract_words_from_stardict(stardict_dir: str,
                     words.append(cleaned_word)
             else:
                 # Target words are found within the HTML-formatted definition
-                text = re.sub(r'<[^>]+>', ' ', definition)
+                text = _HTML_TAG_RE.sub(' ', definition)
                 for t in process_multilingual_translation(text):
                     if target_script in ['arabic', 'cyrillic', 'devanagari', 'cjk']:
                         if target_script == 'cjk':
@@ -1305,53 +1606,114 @@ def extract_words_from_stardict(stardict_dir: str,
     return words, recovered_count
 
 
-def extract_words_from_tei_xml(xml_source: str,
-                              extract_language: str = "target") -> List[str]:
-    """Extract words from TEI XML format.
+# Namespace-qualified TEI tag names, precomputed so the per-element checks
+# are string equality (length-first, usually pointer comparison) rather
+# than an endswith substring scan on every node
+_TEI_NS = '{http://www.tei-c.org/ns/1.0}'
+_TEI_ENTRY = _TEI_NS + 'entry'
+_TEI_ORTH = _TEI_NS + 'orth'
+_TEI_QUOTE = _TEI_NS + 'quote'
+
+
+def _is_tei_tag(tag, qualified: str, local: str) -> bool:
+    """Match a TEI tag by precomputed qualified name, bare name, or — for
+    sources using a non-standard namespace — an endswith fallback."""
+    return (tag == qualified or tag == local
+            or (tag.__class__ is str and tag.endswith('}' + local)))
+
+
+def _collect_tei_entry_words(entry, want_source: bool, want_target: bool,
+                             src_words: List[str], tgt_words: List[str]) -> None:
+    """Collect words from a single TEI <entry> element into the output lists.
+
+    Headwords come from <orth> tags and translations from <quote> tags;
+    one walk over the entry's elements serves both.
+    """
+    for node in entry.iter():
+        tag = node.tag
+        if want_source and _is_tei_tag(tag, _TEI_ORTH, 'orth') and node.text:
+            word = node.text.strip()
+            if is_valid_word(word):
+                src_words.append(word)
+        if want_target and _is_tei_tag(tag, _TEI_QUOTE, 'quote') and node.text:
+            word = node.text.strip()
+            if word.isalpha():
+                tgt_words.append(word)
+
+
+def extract_tei_words_both(xml_source: str,
+                           want_source: bool = True,
+                           want_target: bool = True) -> Tuple[List[str], List[str]]:
+    """Extract source and target words from TEI XML in a single parse.
+
+    TEI sources can run to hundreds of MB, so files are streamed with
+    ``iterparse`` and each ``<entry>`` is released after processing instead
+    of building the full document tree in memory. Parsing dominates the
+    cost, so both languages are collected in the one pass.
 
     Args:
         xml_source: Path to TEI XML file or XML content string
-        extract_language: Either "source" or "target"
+        want_source: Collect source-language headwords
+        want_target: Collect target-language translations
 
     Returns:
-        List of extracted words
+        Tuple of (source_words, target_words)
     """
-    words = []
+    src_words = []
+    tgt_words = []
 
     try:
         if os.path.exists(xml_source):
-            tree = ET.parse(xml_source)
-            root = tree.getroot()
+            if _USING_LXML:
+                # huge_tree lifts libxml2's size limits for very large
+                # FreeDict sources; ID interning is useless work here.
+                context = ET.iterparse(xml_source, events=('end',),
+                                       huge_tree=True, collect_ids=False)
+            else:
+                context = ET.iterparse(xml_source, events=('end',))
+
+            for _, elem in context:
+                if not _is_tei_tag(elem.tag, _TEI_ENTRY, 'entry'):
+                    continue
+                _collect_tei_entry_words(elem, want_source, want_target,
+                                         src_words, tgt_words)
+                elem.clear()
+                if _USING_LXML:
+                    # Drop already-processed siblings so the partial tree
+                    # doesn't grow with the file.
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
         else:
             root = ET.fromstring(xml_source)
-        
-        for entry in root.iter():
-            if not (entry.tag.endswith('}entry') or entry.tag == 'entry'):
-                continue
-            
-            if extract_language == "source":
-                # Extract headwords from <orth> tags
-                for orth in entry.iter():
-                    if ((orth.tag.endswith('}orth') or orth.tag == 'orth') 
-                        and orth.text):
-                        word = orth.text.strip()
-                        if is_valid_word(word):
-                            words.append(word)
-            
-            else:
-                # Extract translations from <quote> tags
-                for quote in entry.iter():
-                    if ((quote.tag.endswith('}quote') or quote.tag == 'quote') 
-                        and quote.text):
-                        word = quote.text.strip()
-                        if word.isalpha():
-                            words.append(word)
-    
-    except ET.ParseError:
+            for entry in root.iter():
+                if not _is_tei_tag(entry.tag, _TEI_ENTRY, 'entry'):
+                    continue
+                _collect_tei_entry_words(entry, want_source, want_target,
+                                         src_words, tgt_words)
+
+    except _ET_PARSE_ERROR:
         # Silently handle malformed XML
         pass
-    
-    return words
+
+    return src_words, tgt_words
+
+
+def extract_words_from_tei_xml(xml_source: str,
+                              extract_language: str = "target") -> List[str]:
+    """Extract words from TEI XML format.
+
+    Args:
+        xml_source: Path to TEI XML file or XML content string
+        extract_language: Either "source" or "target"
+
+    Returns:
+        List of extracted words
+    """
+    wants_source = extract_language == "source"
+    src, tgt = extract_tei_words_both(xml_source,
+                                      want_source=wants_source,
+                                      want_target=not wants_source)
+    return src if wants_source else tgt
 
 
 def determine_wordlist_filenames(dict_path: str) -> Tuple[str, str]:
@@ -1376,6 +1738,19 @@ def determine_wordlist_filenames(dict_path: str) -> Tuple[str, str]:
     return target_fname, source_fname
 
 
+# The only archive members the pipeline reads: the dictionary payloads
+# plus the StarDict index and metadata files. Everything else (source
+# README/COPYING, build files) is skipped at extraction time.
+_NEEDED_MEMBER_SUFFIXES = ('.dict.dz', '.tei', '.idx.gz', '.ifo')
+
+
+def _extract_needed_members(tar: tarfile.TarFile, temp_dir: str) -> None:
+    """Extract only the members the pipeline needs from a tar stream."""
+    for member in tar:
+        if member.name.endswith(_NEEDED_MEMBER_SUFFIXES):
+            tar.extract(member, temp_dir)
+
+
 def extract_from_archive(archive_path: str, temp_dir: str) -> Tuple[Optional[str], Optional[str]]:
     """
     Extract dictionary file from archive.
@@ -1388,10 +1763,30 @@ def extract_from_archive(archive_path: str, temp_dir: str) -> Tuple[Optional[str
         Tuple of (extracted_file_path, file_type)
     """
     try:
-        with tarfile.open(archive_path, 'r:xz') as tar:
-            # RUMBA: tarfile handles .tar.xz archives directly; extraction
-            # happens in a temp dir so subsequent steps work with plain files.
-            tar.extractall(temp_dir)
+        xz = shutil.which('xz')
+        if xz is not None:
+            # Let the native xz binary decompress on its own threads while
+            # Python consumes the tar stream; 'r|' reads the already-decoded
+            # bytes sequentially from the pipe.
+            proc = subprocess.Popen([xz, '-T0', '-dc', archive_path],
+                                    stdout=subprocess.PIPE,
+                                    bufsize=4 * 1024 * 1024)
+            try:
+                with tarfile.open(fileobj=proc.stdout, mode='r|') as tar:
+                    _extract_needed_members(tar, temp_dir)
+            finally:
+                proc.stdout.close()
+                proc.wait()
+        else:
+            # Streaming mode over a 4 MB BufferedReader; members are
+            # inspected and written out as the archive is decoded, with no
+            # random access needed.
+            with open(archive_path, 'rb', buffering=0) as raw, \
+                    io.BufferedReader(raw, buffer_size=4 * 1024 * 1024) as buf, \
+                    tarfile.open(fileobj=buf, mode='r|xz') as tar:
+                # RUMBA: tarfile handles .tar.xz archives directly; extraction
+                # happens in a temp dir so subsequent steps work with plain files.
+                _extract_needed_members(tar, temp_dir)
         
         # Find the dictionary file
         stardict_dir = None
@@ -1429,7 +1824,7 @@ def extract_license_text(path: str, file_type: str) -> Optional[str]:
     try:
         if file_type == 'dict':
             # Read a small portion of the .dict.dz header for "Availability" info
-            with gzip.open(path, 'rt', encoding='utf-8', errors='ignore') as f:
+            with open_dz(path) as f:
                 lines = [next(f, '') for _ in range(40)]
             found = False
             for line in lines:
@@ -1447,7 +1842,7 @@ def extract_license_text(path: str, file_type: str) -> Optional[str]:
                     for line in f:
                         if line.startswith('description='):
                             text = line.split('=', 1)[1].strip()
-                            text = re.sub(r'<[^>]+>', '', text)
+                            text = _HTML_TAG_RE.sub('', text)
                             if 'licen' in text.lower():
                                 return text
 
@@ -1480,10 +1875,19 @@ def save_wordlist(words: List[str], output_file: str, language_name: str) -> int
         return 0
     
     unique_words = sorted(set(words))
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(unique_words))
-    
+
+    # Join and encode in bounded blocks, then write the raw bytes directly:
+    # one C-level encode and one write per 64k words, no text-layer pass,
+    # and peak memory stays at the sorted list plus one block.
+    # No trailing newline, matching the historical join format.
+    block_size = 1 << 16
+    with open(output_file, 'wb', buffering=0) as f:
+        for start in range(0, len(unique_words), block_size):
+            if start:
+                f.write(b'\n')
+            f.write('\n'.join(
+                unique_words[start:start + block_size]).encode('utf-8'))
+
     return len(unique_words)
 
 
@@ -1516,16 +1920,15 @@ def process_dictionary_file(file_path: str,
 
     if file_path.endswith('.dict.dz'):
         # Read the compressed dictionary only once
-        # RUMBA: gzip.open handles the .dz compression; caching lines here keeps
-        # us from re-decompressing the file on multiple passes.
-        with gzip.open(file_path, 'rt', encoding='utf-8', errors='ignore') as f:
-            lines = [ln.rstrip('\n') for ln in f]
+        # RUMBA: read_dz_lines decompresses into one preallocated buffer and
+        # splits once, so the detectors and both extraction passes scan the
+        # same in-memory lines instead of re-reading.
+        lines = read_dz_lines(file_path)
         has_pos_tags = detect_dictionary_has_pos(lines)
 
-        source_words = [] if skip_source else extract_words_from_gzip_content(
-            lines, "source", is_dz_file=True)
-        target_words = [] if skip_target else extract_words_from_gzip_content(
-            lines, "target", is_dz_file=True)
+        source_words, target_words = extract_both(
+            lines, is_dz_file=True,
+            want_source=not skip_source, want_target=not skip_target)
     
     elif file_path.endswith('.tei'):
         # Process TEI XML format
@@ -1533,10 +1936,9 @@ def process_dictionary_file(file_path: str,
         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
             sample = [next(f, '') for _ in range(200)]
         has_pos_tags = detect_dictionary_has_pos(sample)
-        source_words = [] if skip_source else extract_words_from_tei_xml(
-            file_path, "source")
-        target_words = [] if skip_target else extract_words_from_tei_xml(
-            file_path, "target")
+        source_words, target_words = extract_tei_words_both(
+            file_path,
+            want_source=not skip_source, want_target=not skip_target)
     
     elif os.path.isdir(file_path):
         # Process StarDict format directory and receive recovery info
@@ -1546,7 +1948,7 @@ def process_dictionary_file(file_path: str,
                  if f.endswith('.dict.dz')))
             # RUMBA: StarDict packages a gzipped .dict.dz inside a folder;
             # sampling a few lines avoids fully decompressing on this pass.
-            with gzip.open(dz_file, 'rt', encoding='utf-8', errors='ignore') as f:
+            with open_dz(dz_file) as f:
                 sample = [next(f, '') for _ in range(200)]
             has_pos_tags = detect_dictionary_has_pos(sample)
         except (StopIteration, OSError):
@@ -1598,19 +2000,25 @@ def process_dictionary_file(file_path: str,
 
 
 @timed
-def process_single_dictionary(dict_name: str) -> None:
+def process_single_dictionary(dict_name: str) -> List[Tuple[str, str, str]]:
     """
     Process a single dictionary by name.
-    
+
     Args:
         dict_name: Name of dictionary file in dictionaries folder
+
+    Returns:
+        License table rows collected for this dictionary (also appended to
+        the global LICENSE_TABLE_ROWS). Returned explicitly so worker
+        processes can hand their rows back to the parent.
     """
+    rows: List[Tuple[str, str, str]] = []
     dict_path = os.path.join("dictionaries", dict_name)
-    
+
     if not os.path.exists(dict_path):
         logger.error(f"Dictionary not found: {dict_path}")
-        return
-    
+        return rows
+
     target_output_file, source_output_file = determine_wordlist_filenames(dict_name)
     
     # Ensure output paths are within the 'wordlists' folder
@@ -1630,7 +2038,7 @@ def process_single_dictionary(dict_name: str) -> None:
         logger.info(f"   License: {lic}")
         pos_found, src_ct, tgt_ct = process_dictionary_file(
             dict_path, source_output_file, target_output_file, src_lang, tgt_lang)
-        LICENSE_TABLE_ROWS.append((os.path.basename(target_output_file), dict_name, lic))
+        rows.append((os.path.basename(target_output_file), dict_name, lic))
         _print_license_header()
         _log_license_row(os.path.basename(target_output_file), dict_name, lic)
 
@@ -1651,12 +2059,41 @@ def process_single_dictionary(dict_name: str) -> None:
                 logger.info(f"   License: {lic}")
                 pos_found, src_ct, tgt_ct = process_dictionary_file(
                     extracted_file, source_output_file, target_output_file, src_lang, tgt_lang)
-                LICENSE_TABLE_ROWS.append((os.path.basename(target_output_file), dict_name, lic))
+                rows.append((os.path.basename(target_output_file), dict_name, lic))
                 _print_license_header()
                 _log_license_row(os.path.basename(target_output_file), dict_name, lic)
             else:
                 logger.error(f"⚠ Could not extract dictionary from: {dict_path}")
 
+    LICENSE_TABLE_ROWS.extend(rows)
+    return rows
+
+
+def _init_worker(log_level: int, prefer_english: bool, pos_filters: dict) -> None:
+    """Seed per-process globals in a pool worker.
+
+    On Linux workers fork and inherit these, but seeding explicitly keeps
+    behaviour identical under spawn-based start methods too.
+    """
+    global PREFER_ENGLISH
+    logger.setLevel(log_level)
+    PREFER_ENGLISH = prefer_english
+    POS_FILTERS.clear()
+    POS_FILTERS.update(pos_filters)
+
+
+def _process_dictionary_worker(
+        dict_file: str) -> Tuple[str, List[Tuple[str, str, str]], Optional[str]]:
+    """Process one dictionary inside a worker process.
+
+    Returns the dictionary name, its license rows, and an error message
+    (None on success) so the parent process can aggregate results.
+    """
+    try:
+        return dict_file, process_single_dictionary(dict_file), None
+    except Exception as e:
+        return dict_file, [], str(e)
+
 
 def process_all_dictionaries() -> None:
     """Process all dictionary files in the dictionaries folder."""
@@ -1680,15 +2117,30 @@ def process_all_dictionaries() -> None:
     logger.info("-" * 60)
     
     success_count = 0
-    for dict_file in dict_files:
-        try:
-            process_single_dictionary(dict_file)
-            success_count += 1
-        except Exception as e:
-            logger.error(f"Error processing {dict_file}: {e}")
-        finally:
+    rows_by_file = {}
+    # Each dictionary is independent, so fan the files out across worker
+    # processes; every worker writes its own wordlists and hands its license
+    # rows back. Results are handled as they finish, so one slow dictionary
+    # doesn't delay error reporting for the rest.
+    with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_worker,
+            initargs=(logger.level, PREFER_ENGLISH, dict(POS_FILTERS))) as executor:
+        futures = [executor.submit(_process_dictionary_worker, f)
+                   for f in dict_files]
+        for future in as_completed(futures):
+            dict_file, rows, error = future.result()
+            if error is None:
+                success_count += 1
+                rows_by_file[dict_file] = rows
+            else:
+                logger.error(f"Error processing {dict_file}: {error}")
             logger.info("-" * 60)
 
+    # Reassemble license rows in input order regardless of completion order
+    for dict_file in dict_files:
+        LICENSE_TABLE_ROWS.extend(rows_by_file.get(dict_file, []))
+
     logger.info(f"Processed {success_count}/{len(dict_files)} files successfully")
 
     write_license_file(LICENSE_TABLE_ROWS)
@@ -1739,7 +2191,7 @@ Examples:
     PREFER_ENGLISH = args.prefer_english
 
     if args.pos:
-        POS_FILTERS['include'] = [p.lower() for p in args.pos]
+        POS_FILTERS['include'] = frozenset(sys.intern(p.lower()) for p in args.pos)
     
     if args.command == 'single':
         if not args.filename: